@@ -1,13 +1,16 @@
 import codecs
 import csv
+import mmap
 import os
+import re
 import sys
-from collections import OrderedDict
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
 from logging import DEBUG, INFO, basicConfig, getLogger
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, Final, Iterator, TextIO
 
-import pandas as pd
 import yaml
 from pydantic import (
     BaseModel,
@@ -19,6 +22,25 @@ from pydantic import (
     field_validator,
 )
 
+try:
+    # The C-accelerated loader, much faster than the pure-Python one.
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+
+try:
+    # Optional dependency. Enables a single-pass replacement for large mapping CSVs.
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    # Optional dependency. Often faster than "re" on large alternations and
+    # supports POSIX longest-match semantics.
+    import regex
+except ImportError:
+    regex = None
+
 
 class EncodingStr:
     """Represents a validated string that must be a valid text encoding name.
@@ -38,11 +60,18 @@ class EncodingStr:
         if not isinstance(arg, str):
             raise TypeError(f'The argument must be a string, got "{arg}" [{type(arg)}].')
 
+        EncodingStr.__lookup_encoding(arg)
+        return arg
+
+    # The registry lookup is not cheap, and the same encoding string is usually
+    # validated once per config section. Failed lookups are not cached.
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def __lookup_encoding(arg: str):
         try:
             codecs.lookup(arg)
         except LookupError as err:
             raise ValueError(f'"{arg}" is not supported as an encoding string.') from err
-        return arg
 
 
 class TxtsInFolderConfig(BaseModel):
@@ -57,6 +86,7 @@ class TxtsInFolderConfig(BaseModel):
     ENCODING: EncodingStr
 
     __txt_paths: tuple[Path, ...] = PrivateAttr()
+    __encoding_str: str = PrivateAttr()
 
     model_config = ConfigDict(
         frozen=True, extra='forbid', strict=True, arbitrary_types_allowed=True
@@ -84,25 +114,37 @@ class TxtsInFolderConfig(BaseModel):
             ValueError: If the folder is blank or if any non-file object is in the folder.
         """
 
-        txt_paths = tuple(path.iterdir())
+        # os.scandir caches file types from the directory read, while
+        # Path.iterdir + Path.is_file costs one extra stat call per entry.
+        with os.scandir(path) as dir_entries:
+            entries = list(dir_entries)
 
-        if not txt_paths:
+        if not entries:
             raise ValueError(f'No txts in the folder.: "{path}"')
 
-        for txt_path in txt_paths:
-            if not txt_path.is_file():
+        for entry in entries:
+            if not entry.is_file():
                 raise ValueError(f'Non-file object in the folder.: "{path}"')
 
-        return txt_paths
+        return tuple(Path(entry.path) for entry in entries)
 
     def __init__(self, **data):
         super().__init__(**data)
         self.__txt_paths = self.__get_child_file_paths(self.FOLDER_PATH)
+        self.__encoding_str = str(self.ENCODING)
 
     @property
     def txt_paths(self) -> tuple[Path, ...]:
         return self.__txt_paths
 
+    @property
+    def encoding_str(self) -> str:
+        return self.__encoding_str
+
+
+# Guards the lazy CSV parse in ReplaceMappingCsv.load against concurrent threads.
+_mapping_csv_load_lock = threading.Lock()
+
 
 class ReplaceMappingCsv(BaseModel):
     """Represents a CSV file with columns of find & replace strings.
@@ -123,7 +165,14 @@ class ReplaceMappingCsv(BaseModel):
         frozen=True, extra='forbid', strict=True, arbitrary_types_allowed=True
     )
 
-    __mapping_dict: OrderedDict[str, str] = PrivateAttr()
+    __mapping_dict: dict[str, str] | None = PrivateAttr(default=None)
+    __encoding_str: str = PrivateAttr()
+    __bytes_mapping_dicts: dict[str, dict[bytes, bytes] | None] = PrivateAttr(
+        default_factory=dict
+    )
+    __automaton: Any = PrivateAttr(default=None)
+    # A compiled "regex" or "re" pattern.
+    __alternation_pattern: Any = PrivateAttr(default=None)
 
     @field_validator('PATH', mode='before')
     @classmethod
@@ -141,15 +190,16 @@ class ReplaceMappingCsv(BaseModel):
 
     def __read_csv(
         self, allow_empty: bool = True, use_columns: tuple[str, ...] = tuple()
-    ) -> pd.DataFrame:
-        """Reads the configured CSV file into a pandas DataFrame.
+    ) -> tuple[list[str], list[list[str]]]:
+        """Reads the configured CSV file into headers & rows.
 
         Args:
             allow_empty: Whether to allow empty rows below header row.
             use_columns: Columns to use in the CSV.
 
         Returns:
-            pd.DataFrame: DataFrame containing the contents of the CSV file.
+            list[str]: Column names in the header row.
+            list[list[str]]: Rows below the header row.
         """
 
         if not isinstance(allow_empty, bool):
@@ -157,7 +207,7 @@ class ReplaceMappingCsv(BaseModel):
                 f'The argument must be a bool, got "{allow_empty}" [{type(allow_empty)}].'
             )
 
-        with open(self.PATH, 'r', encoding=str(self.ENCODING), newline='') as fr:
+        with open(self.PATH, 'r', encoding=self.__encoding_str, newline='') as fr:
 
             reader = csv.reader(fr)
 
@@ -167,11 +217,13 @@ class ReplaceMappingCsv(BaseModel):
                 raise ValueError(f'No columns to parse from file.: "{self.PATH}"') from err
 
             headers_len = len(headers)
-            broken_line_ids = [
-                str(line_id)
-                for line_id, row in enumerate(reader, start=2)
-                if len(row) not in (0, headers_len)
-            ]
+            rows: list[list[str]] = []
+            broken_line_ids: list[str] = []
+            for line_id, row in enumerate(reader, start=2):
+                if len(row) == headers_len:
+                    rows.append(row)
+                elif len(row) != 0:  # Blank lines are skipped.
+                    broken_line_ids.append(str(line_id))
 
         if missing_columns := [col for col in use_columns if col not in headers]:
             missing_columns_str = '", "'.join(missing_columns)
@@ -184,39 +236,45 @@ class ReplaceMappingCsv(BaseModel):
                 f'{headers_len} columns are expected in the CSV, but not at: line {broken_line_ids_str}'
             )
 
-        df = pd.read_csv(self.PATH, encoding=str(self.ENCODING), dtype=str, keep_default_na=False)
-        # Overwrite automatically converted strings (e.g., '' -> 'Unnamed: 1', ['a', 'a'] -> ['a', 'a.1'])
-        df.columns = pd.Index(headers)
-
-        if not allow_empty and df.shape[0] == 0:
+        if not allow_empty and not rows:
             raise ValueError('Empty rows in the CSV.')
 
-        return df
+        return headers, rows
 
     @staticmethod
-    def __create_mapping_dict_from_df(
-        df: pd.DataFrame, two_columns: tuple[str, str]
-    ) -> tuple[OrderedDict[str, str], list[str]]:
-        """Create mapping dict from two columns in a DataFrame.
+    def __create_mapping_dict_from_rows(
+        headers: list[str], rows: list[list[str]], two_columns: tuple[str, str]
+    ) -> tuple[dict[str, str], list[str]]:
+        """Create mapping dict from two columns in CSV rows.
 
         Args:
-            df: Source DataFrame.
-            two_columns: Two column names in the df. The former is key, and the latter is value.
+            headers: Column names in the header row.
+            rows: Rows below the header row.
+            two_columns: Two column names in the headers. The former is key, and the latter
+                is value.
 
         Returns:
-            OrderedDict[str, str]: Mapping dict which is ordered by the order in CSV.
+            dict[str, str]: Mapping dict which is ordered by the order in CSV.
             list[str]: Duplicated keys in the CSV.
         """
 
-        mapping_dict: OrderedDict[str, str] = OrderedDict()
+        first_column_index = headers.index(two_columns[0])
+        second_column_index = headers.index(two_columns[1])
+
+        mapping_dict: dict[str, str] = {}
         duplicated_first_column_values: list[str] = []
-        for find_str, replace_str in df[list(two_columns)].values:
+        duplicated_first_column_values_set: set[str] = set()
+        for row in rows:
+            # Interned keys hash & compare by pointer on the lookup fast path.
+            find_str, replace_str = sys.intern(row[first_column_index]), row[second_column_index]
 
             if find_str not in mapping_dict:
                 mapping_dict[find_str] = replace_str
                 continue
 
-            if find_str not in duplicated_first_column_values:
+            # The set is for an O(1) membership check, the list keeps the CSV order.
+            if find_str not in duplicated_first_column_values_set:
+                duplicated_first_column_values_set.add(find_str)
                 duplicated_first_column_values.append(find_str)
 
         return mapping_dict, duplicated_first_column_values
@@ -233,27 +291,337 @@ class ReplaceMappingCsv(BaseModel):
             self.REPLACE_STRING_COLUMN,
         )
 
-        df = self.__read_csv(allow_empty=False, use_columns=find_and_replace_columns)
-        self.__mapping_dict, duplicated_find_strings = self.__create_mapping_dict_from_df(
-            df, find_and_replace_columns
+        headers, rows = self.__read_csv(allow_empty=False, use_columns=find_and_replace_columns)
+        mapping_dict, duplicated_find_strings = self.__create_mapping_dict_from_rows(
+            headers, rows, find_and_replace_columns
         )
         if duplicated_find_strings:
             joined_string = '", "'.join(duplicated_find_strings)
             raise ValueError(f'Duplicated values in find strings.: "{joined_string}"')
-        if '' in self.__mapping_dict:
+        if '' in mapping_dict:
             raise ValueError('Blank string in find strings.')
 
+        automaton = None
+        alternation_pattern = None
+        if self.__chained_replaces_equal_single_pass(mapping_dict):
+            automaton = self.__build_automaton(mapping_dict)
+            if automaton is None:
+                alternation_pattern = self.__build_alternation_pattern(mapping_dict)
+
+        # Assigned only after every validation has passed, so a failed load leaves
+        # "__mapping_dict" as None and the next load() retries instead of silently
+        # using an invalid mapping.
+        self.__automaton = automaton
+        self.__alternation_pattern = alternation_pattern
+        self.__mapping_dict = mapping_dict
+
+    @staticmethod
+    def __chained_replaces_equal_single_pass(mapping_dict: dict[str, str]) -> bool:
+        """Judge whether one left-to-right scan replaces the same as the chained loop.
+
+        The chained loop re-scans each pattern's output with the following patterns,
+        so a single pass is equivalent only when no replacement can create, remove
+        or shift another match, whatever the input text is. Checked conservatively.
+        """
+
+        find_strs = list(mapping_dict.keys())
+        replace_strs = list(mapping_dict.values())
+
+        # A blank replacement joins the surrounding text, which may create new matches.
+        if '' in replace_strs:
+            return False
+
+        # A find string inside another find string or inside a replacement string
+        # makes the result depend on the order the patterns are applied in.
+        separator = '\x00'
+        if any(separator in string for string in find_strs + replace_strs):
+            return False
+        joined_find_strs = separator.join(find_strs)
+        joined_replace_strs = separator.join(replace_strs)
+        for find_str in find_strs:
+            if joined_find_strs.count(find_str) > 1:
+                return False
+            if find_str in joined_replace_strs:
+                return False
+        for replace_str in replace_strs:
+            if replace_str in joined_find_strs:
+                return False
+
+        # A find string overlapping another find string or the edge of a replacement
+        # string can match across a replaced part only in the chained loop.
+        find_prefix_to_str = {}
+        for find_str in find_strs:
+            for i in range(1, len(find_str)):
+                prefix = find_str[:i]
+                find_prefix_to_str[prefix] = (
+                    find_str if prefix not in find_prefix_to_str else None
+                )
+        replace_prefixes = {
+            replace_str[:i] for replace_str in replace_strs for i in range(1, len(replace_str))
+        }
+        for find_str in find_strs:
+            for i in range(1, len(find_str)):
+                suffix = find_str[i:]
+                if find_prefix_to_str.get(suffix, find_str) != find_str:
+                    return False
+                if suffix in replace_prefixes:
+                    return False
+        for replace_str in replace_strs:
+            for i in range(1, len(replace_str)):
+                if replace_str[i:] in find_prefix_to_str:
+                    return False
+
+        return True
+
+    @staticmethod
+    def __build_automaton(mapping_dict: dict[str, str]) -> Any:
+        """Build an Aho-Corasick automaton for a single-pass replacement.
+
+        Returns:
+            Any: The automaton, or None when "pyahocorasick" is not installed.
+        """
+
+        if ahocorasick is None:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for find_str, replace_str in mapping_dict.items():
+            automaton.add_word(find_str, (find_str, replace_str))
+        automaton.make_automaton()
+        return automaton
+
+    @staticmethod
+    def __build_alternation_pattern(mapping_dict: dict[str, str]) -> Any:
+        """Build a regex alternation of the find strings for a single-pass replacement.
+
+        Compiled with the "regex" module in POSIX longest-match mode when installed.
+        With "re", the alternation is tried leftmost-first instead, so longer find
+        strings are put first to match the longest one.
+
+        Returns:
+            Any: The compiled pattern, or None when compilation fails
+                (e.g., too many find strings).
+        """
+
+        sorted_find_strs = sorted(mapping_dict, key=len, reverse=True)
+
+        if regex is not None:
+            try:
+                return regex.compile(
+                    '|'.join(regex.escape(find_str) for find_str in sorted_find_strs),
+                    flags=regex.POSIX,
+                )
+            except regex.error:
+                pass
+
+        try:
+            return re.compile('|'.join(re.escape(find_str) for find_str in sorted_find_strs))
+        except re.error:
+            return None
+
     def __init__(self, **data):
         super().__init__(**data)
-        self.__read_csv_into_mapping_dict()
+        self.__encoding_str = str(self.ENCODING)
+
+    @property
+    def encoding_str(self) -> str:
+        return self.__encoding_str
+
+    def load(self) -> None:
+        """Read the CSV into the mapping dict, unless already done.
+
+        The CSV is not parsed in __init__ but on the first use (or this call), so
+        constructing the config stays cheap for callers which never replace.
+        Thread-safe; a no-op when the mapping dict is already loaded.
+        """
+
+        if self.__mapping_dict is not None:
+            return
+        with _mapping_csv_load_lock:
+            if self.__mapping_dict is None:
+                self.__read_csv_into_mapping_dict()
+
+    def __get_mapping_dict(self) -> dict[str, str]:
+        self.load()
+        return self.__mapping_dict
+
+    def __iter_single_pass_matches(self, data: str) -> Iterator[tuple[int, int, str]]:
+        """Yield (start index, end index, replace string) of every match from left to right.
+
+        Only usable when the automaton or the alternation pattern is built.
+        """
+
+        if self.__automaton is not None:
+            cursor = 0
+            for end_index, (find_str, replace_str) in self.__automaton.iter(data):
+                start_index = end_index - len(find_str) + 1
+                if start_index < cursor:
+                    continue
+                yield start_index, end_index + 1, replace_str
+                cursor = end_index + 1
+            return
+
+        for match in self.__alternation_pattern.finditer(data):
+            # The match is a fresh string; interning it makes the dict lookup
+            # compare the interned key by pointer.
+            yield match.start(), match.end(), self.__mapping_dict[sys.intern(match.group(0))]
+
+    def iter_replace(self, data: str) -> Iterator[str]:
+        """Replace a text with the mapping dict, yielding the result piece by piece.
+
+        Consuming the pieces directly (e.g. with "writelines") avoids the second
+        copy of the text which joining them into one string would allocate. With
+        the chained loop the whole replaced text is yielded as a single piece.
+        """
+
+        self.load()
+
+        if self.__automaton is None and self.__alternation_pattern is None:
+            yield self.replace_text(data)
+            return
+
+        cursor = 0
+        for start_index, end_index, replace_str in self.__iter_single_pass_matches(data):
+            if cursor < start_index:
+                yield data[cursor:start_index]
+            if replace_str:
+                yield replace_str
+            cursor = end_index
+        if cursor < len(data):
+            yield data[cursor:]
 
     def replace_text(self, data: str) -> str:
         """Replace a text with the mapping dict."""
 
-        replaced_text = data
-        for find_str, replace_str in self.__mapping_dict.items():
-            replaced_text = replaced_text.replace(find_str, replace_str)
-        return replaced_text
+        mapping_dict = self.__get_mapping_dict()
+
+        if self.__automaton is None and self.__alternation_pattern is None:
+            replaced_text = data
+            for find_str, replace_str in mapping_dict.items():
+                # The membership check is one scan without the new string that
+                # str.replace always allocates, so absent patterns become cheap.
+                if find_str in replaced_text:
+                    replaced_text = replaced_text.replace(find_str, replace_str)
+            return replaced_text
+
+        return ''.join(self.iter_replace(data))
+
+    @staticmethod
+    def __replaces_bytes_like_characters(encoding: str) -> bool:
+        """Judge whether replacing raw bytes equals replacing decoded characters.
+
+        True for UTF-8, whose multi-byte sequences never match across character
+        boundaries, and for encodings which decode every byte to one character.
+        """
+
+        if codecs.lookup(encoding).name in ('utf-8', 'ascii'):
+            return True
+        try:
+            return len(bytes(range(256)).decode(encoding)) == 256
+        except (UnicodeDecodeError, ValueError):
+            return False
+
+    def __get_bytes_mapping_dict(self, encoding: str) -> dict[bytes, bytes] | None:
+        """Get the mapping dict encoded into bytes of the encoding, None if impossible."""
+
+        encoding_name = codecs.lookup(encoding).name
+        if encoding_name in self.__bytes_mapping_dicts:
+            return self.__bytes_mapping_dicts[encoding_name]
+
+        bytes_mapping_dict: dict[bytes, bytes] | None = None
+        if self.__replaces_bytes_like_characters(encoding_name):
+            try:
+                bytes_mapping_dict = dict(
+                    (find_str.encode(encoding_name), replace_str.encode(encoding_name))
+                    for find_str, replace_str in self.__get_mapping_dict().items()
+                )
+            except UnicodeEncodeError:
+                bytes_mapping_dict = None
+
+        self.__bytes_mapping_dicts[encoding_name] = bytes_mapping_dict
+        return bytes_mapping_dict
+
+    def can_replace_bytes(self, encoding: str) -> bool:
+        """Judge whether "replace_bytes" is usable for texts in the encoding."""
+
+        return self.__get_bytes_mapping_dict(encoding) is not None
+
+    def replace_bytes(self, data: bytes | mmap.mmap, encoding: str) -> bytes | mmap.mmap:
+        """Replace a text of raw bytes with the mapping dict.
+
+        Skips the decode & encode round trip of "replace_text"; bytes.replace runs
+        in a tight C loop over the raw buffer.
+
+        Args:
+            data: Text to replace, as raw bytes or a read-only mmap of them.
+            encoding: Encoding the bytes are in. Must satisfy "can_replace_bytes".
+
+        Returns:
+            bytes | mmap.mmap: The replaced bytes, or "data" itself when no find
+                string occurs in it.
+
+        Raises:
+            ValueError: If the encoding cannot be replaced at the byte level.
+        """
+
+        bytes_mapping_dict = self.__get_bytes_mapping_dict(encoding)
+        if bytes_mapping_dict is None:
+            raise ValueError(f'Byte-level replacement is not usable for encoding "{encoding}".')
+
+        replaced_bytes: bytes | None = None
+        for find_bytes, replace_bytes in bytes_mapping_dict.items():
+            if replaced_bytes is None:
+                # ".find" scans a mmap view in place, so nothing is copied into
+                # user space as a bytes object until a replacement actually fires.
+                if data.find(find_bytes) == -1:
+                    continue
+                replaced_bytes = bytes(data)
+            # The membership check is one scan without the new bytes object that
+            # bytes.replace always allocates, so absent patterns become cheap.
+            if find_bytes in replaced_bytes:
+                replaced_bytes = replaced_bytes.replace(find_bytes, replace_bytes)
+        return data if replaced_bytes is None else replaced_bytes
+
+    def replace_stream(self, reader: TextIO, writer: TextIO, chunk_size: int = 8 * 1024 * 1024):
+        """Replace a text read from "reader" with the mapping dict & write it into "writer".
+
+        Reads the text chunk by chunk so that the whole text is never held in memory.
+        Falls back to replacing the whole text at once when the chained loop must be
+        used, because its replacements can interact over any distance.
+
+        Args:
+            reader: Stream of the text to replace.
+            writer: Stream to write the replaced text into.
+            chunk_size: Characters to read from "reader" at a time.
+        """
+
+        self.load()
+
+        if self.__automaton is None and self.__alternation_pattern is None:
+            writer.writelines(self.iter_replace(reader.read()))
+            return
+
+        max_find_str_len = max(map(len, self.__mapping_dict))
+        carry = ''
+        while chunk := reader.read(chunk_size):
+            buffer = carry + chunk
+            # Matches starting in the last (max_find_str_len - 1) characters may
+            # continue into the next chunk, so that tail is carried over as is.
+            boundary = len(buffer) - (max_find_str_len - 1)
+            pieces: list[str] = []
+            cursor = 0
+            for start_index, end_index, replace_str in self.__iter_single_pass_matches(buffer):
+                if start_index >= boundary:
+                    break
+                pieces.append(buffer[cursor:start_index])
+                pieces.append(replace_str)
+                cursor = end_index
+            if cursor < boundary:
+                pieces.append(buffer[cursor:boundary])
+                cursor = boundary
+            writer.writelines(pieces)
+            carry = buffer[cursor:]
+        writer.writelines(self.iter_replace(carry))
 
 
 class InputConfig(BaseModel):
@@ -326,7 +694,7 @@ class Config(BaseModel):
         """
 
         with open(path, 'r', encoding='utf-8') as fr:
-            content = yaml.safe_load(fr)
+            content = yaml.load(fr, Loader=YamlSafeLoader)
         return cls(**content)
 
 
@@ -356,6 +724,49 @@ def __read_arg_config_path():
     return CONFIG
 
 
+def __replace_one_txt(
+    original_txt_path: Path,
+    replaced_txt_path: Path,
+    encoding: str,
+    mapping_csv: ReplaceMappingCsv,
+):
+    """Replace one TXT with the mapping CSV & write the result.
+
+    Run in a worker process; every argument is pickled into it.
+
+    Args:
+        original_txt_path: Path of the TXT to replace.
+        replaced_txt_path: Path to write the replaced TXT into.
+        encoding: Encoding of both TXTs.
+        mapping_csv: Configuration holding the mapping dict.
+    """
+
+    if mapping_csv.can_replace_bytes(encoding):
+        # Byte-level replacement never decodes, so line break codes are kept as is.
+        # The mmap lets the kernel page the TXT in on demand instead of copying it.
+        with open(original_txt_path, 'rb') as frb:
+            try:
+                original_bytes: bytes | mmap.mmap = mmap.mmap(
+                    frb.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except (ValueError, OSError):  # e.g., a blank TXT cannot be mapped.
+                original_bytes = frb.read()
+            try:
+                with open(replaced_txt_path, 'wb') as fwb:
+                    fwb.write(mapping_csv.replace_bytes(original_bytes, encoding))
+            finally:
+                if isinstance(original_bytes, mmap.mmap):
+                    original_bytes.close()
+        return
+
+    # Prevents line break codes from being unified with "newline=''".
+    with (
+        open(original_txt_path, 'r', encoding=encoding, newline='') as fr,
+        open(replaced_txt_path, 'w', encoding=encoding, newline='') as fw,
+    ):
+        mapping_csv.replace_stream(fr, fw)
+
+
 def __replace_txts_with_mapping_csv():
 
     basicConfig(level=INFO, format='%(asctime)s [%(levelname)s] %(name)s: %(message)s')
@@ -367,53 +778,52 @@ def __replace_txts_with_mapping_csv():
 
     original_txts_config = CONFIG.INPUT.ORIGINAL_TXTS
     mapping_csv = CONFIG.INPUT.REPLACE_MAPPING_CSV
-    encoding = str(original_txts_config.ENCODING)
+    encoding = original_txts_config.encoding_str
+
+    logger.info(f'Reading CSV "{mapping_csv.PATH}"...')
+    try:
+        # Parse once in the parent; the workers receive the parsed mapping.
+        mapping_csv.load()
+    except Exception:
+        logger.exception(f'Failed to parse the CSV.: "{mapping_csv.PATH}"')
+        sys.exit(1)
+    # Encode the byte-level mapping once in the parent too, so every worker task
+    # receives it instead of re-encoding it per TXT.
+    mapping_csv.can_replace_bytes(encoding)
 
     logger.info(f'Total TXTs count: {len(original_txts_config.txt_paths)}.')
 
-    exceptions = []
-    for original_txt_path in original_txts_config.txt_paths:
+    failures: list[tuple[Path, Path, Exception]] = []
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
 
-        logger.info('---')
+        future_to_paths: dict[Future, tuple[Path, Path]] = {}
+        for original_txt_path in original_txts_config.txt_paths:
+            replaced_txt_path = CONFIG.OUTPUT.FOLDER_PATH / original_txt_path.name
+            future = executor.submit(
+                __replace_one_txt, original_txt_path, replaced_txt_path, encoding, mapping_csv
+            )
+            future_to_paths[future] = (original_txt_path, replaced_txt_path)
 
-        logger.info(f'Reading TXT "{original_txt_path}"...')
-        try:
-            # Prevents line break codes from being unified to "\n" with "newline=''".
-            with open(original_txt_path, 'r', encoding=encoding, newline='') as fr:
-                original_text = fr.read()
-        except Exception as err:
-            message = f'Failed to read TXT "{original_txt_path}".'
-            err.add_note(message)
-            exceptions.append(err)
-            logger.error(message)
-            continue
+        for future, (original_txt_path, replaced_txt_path) in future_to_paths.items():
 
-        logger.info(f'Replacing with CSV "{mapping_csv.PATH}"...')
-        try:
-            replaced_text = mapping_csv.replace_text(original_text)
-        except Exception as err:
-            message = f'Failed to replace with CSV "{mapping_csv.PATH}".'
-            err.add_note(message)
-            exceptions.append(err)
-            logger.error(message)
-            continue
+            logger.info('---')
 
-        replaced_txt_path = CONFIG.OUTPUT.FOLDER_PATH / original_txt_path.name
-        logger.info(f'Writing new TXT "{replaced_txt_path}"...')
-        try:
-            # Prevents line break codes from being unified to OS-default with "newline=''".
-            with open(replaced_txt_path, 'w', encoding=encoding, newline='') as fw:
-                fw.write(replaced_text)
-        except Exception as err:
-            message = f'Failed to write new TXT "{replaced_txt_path}".'
-            err.add_note(message)
-            exceptions.append(err)
-            logger.error(message)
-            continue
+            logger.info(f'Replacing TXT "{original_txt_path}" with CSV "{mapping_csv.PATH}"...')
+            if (err := future.exception()) is not None:
+                # The note explaining the failure is formatted only once at the
+                # ExceptionGroup assembly below.
+                failures.append((original_txt_path, replaced_txt_path, err))
+                logger.error('Failed to replace TXT "%s".', original_txt_path)
 
     logger.info('---')
 
-    if exceptions:
+    if failures:
+        exceptions = []
+        for original_txt_path, replaced_txt_path, err in failures:
+            err.add_note(
+                f'Failed to replace TXT "{original_txt_path}" into "{replaced_txt_path}".'
+            )
+            exceptions.append(err)
         try:
             raise ExceptionGroup('Some files are failed to be processed.', exceptions)
         except ExceptionGroup: